@@ -0,0 +1,75 @@
+"""
+Shared parametrization tables for the test suite.
+Tables are tuples, and each has a matching tuple of readable test IDs
+so pytest does not have to build them from the values during collection.
+"""
+
+# --- Authors ---
+
+AUTHOR_ID_AS_STRING = ("abc", "123abc", None, " ") # Invalid author IDs that are not integers
+AUTHOR_ID_AS_STRING_IDS = ("abc", "num_prefix", "none", "space")
+
+AUTHOR_ID_NOT_VALID_INT = (-1, 0) # Invalid author IDs that are not positive integers
+AUTHOR_ID_NOT_VALID_INT_IDS = ("negative", "zero")
+
+AUTHOR_NULLABLE_FIELDS = ("firstName", "lastName") # Fields that can be omitted in POST/PUT requests
+AUTHOR_NULLABLE_FIELDS_IDS = AUTHOR_NULLABLE_FIELDS
+
+AUTHOR_BAD_VALUES = ( # Invalid values for required fields in POST/PUT requests
+    ("id", "string_instead_of_int"),
+    ("idBook", "string_instead_of_int"),
+    ("firstName", 12345),
+    ("lastName", 12345),
+)
+AUTHOR_BAD_VALUES_IDS = ("id-str", "idBook-str", "firstName-int", "lastName-int")
+
+AUTHOR_WRONG_METHODS = ("PATCH",) # Methods that should not be allowed on /Authors endpoint
+# These methods should return 405 Method Not Allowed
+AUTHOR_WRONG_METHODS_IDS = AUTHOR_WRONG_METHODS
+
+AUTHOR_BOOKS_ID_AS_STRING = AUTHOR_ID_AS_STRING # Invalid book IDs that are not integers
+AUTHOR_BOOKS_ID_AS_STRING_IDS = AUTHOR_ID_AS_STRING_IDS
+
+AUTHOR_BOOKS_WRONG_METHODS = (
+    "POST",
+    "PUT",
+    "DELETE",
+    "PATCH"
+) # Methods that should not be allowed on /Authors/authors/books/{idBook} endpoint
+AUTHOR_BOOKS_WRONG_METHODS_IDS = AUTHOR_BOOKS_WRONG_METHODS
+
+# --- Books ---
+
+BOOK_ID_AS_STRING = ("abc", "123abc", None, " ") # Invalid book IDs that are not integers.
+# These should return 400 Bad Request when used in GET/PUT/DELETE /Books/{id} endpoints.
+BOOK_ID_AS_STRING_IDS = ("abc", "num_prefix", "none", "space")
+
+BOOK_ID_NOT_VALID_INT = (-1, 0) # Invalid book IDs that are not positive integers.
+# These should return 404 Not Found when used in GET /Books/{id} endpoint.
+BOOK_ID_NOT_VALID_INT_IDS = ("negative", "zero")
+
+BOOK_NULLABLE_FIELDS = (
+    "title",
+    "description",
+    "excerpt"
+)  # Fields that can be nullable in the book model.
+# These fields can be omitted when creating or updating a book,
+# and the API should handle them gracefully.
+BOOK_NULLABLE_FIELDS_IDS = BOOK_NULLABLE_FIELDS
+
+BOOK_BAD_VALUES = ( # Invalid values for required fields that should return 400 Bad Request
+    # when used in POST or PUT requests.
+    # Each tuple contains the field name and a bad value that should trigger a validation error.
+    ("id", "string_instead_of_int"),
+    ("pageCount", "string_instead_of_int"),
+    ("publishDate", 12345),  # not a valid date (normally expects string in ISO format)
+    ("publishDate", "not-a-date"), # not a valid date
+    ("publishDate", "2025-13-01"), # not a valid date
+    ("publishDate", "2025-02-30"), # not a valid date
+    ("publishDate", "01-01-2025"), # not a valid date
+)
+BOOK_BAD_VALUES_IDS = tuple(f"{field}-{value!r}" for field, value in BOOK_BAD_VALUES)
+
+BOOK_WRONG_METHODS = ("PATCH",) # Methods that should not be allowed on /Books endpoint
+# These methods should return 405 Method Not Allowed
+BOOK_WRONG_METHODS_IDS = BOOK_WRONG_METHODS
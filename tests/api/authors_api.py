@@ -3,7 +3,6 @@ API client for interacting with the Authors endpoint of the online bookstore.
 This client provides methods to perform CRUD operations on authors.
 """
 
-import requests
 from tests.api import common_api
 
 class AuthorsAPI(common_api.CommonAPI):
@@ -17,95 +16,63 @@ class AuthorsAPI(common_api.CommonAPI):
         """
         Initializes the AuthorsAPI client with the base URL for the Authors endpoint.
         """
-        super().__init__()
-        self.base_url = self._create_base_url("/api/v1/Authors")
+        super().__init__("/api/v1/Authors")
+        self._by_book = self.base_url + "/authors/books/{}"
 
-    def get_authors(self, headers=None):
+    def get_authors(self, headers=None, fresh=False):
         """
         Fetches the list of all authors from the API.
+        Pass fresh=True to bypass the cached response.
         Returns:
             Response: The response object containing the list of authors.
         """
-        return requests.get(
-            url=self.base_url,
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._get(self.base_url, headers, fresh)
 
-    def get_author(self, author_id, headers=None):
+    def get_author(self, author_id, headers=None, fresh=False):
         """
         Fetches a single author by its ID from the API.
+        Pass fresh=True to bypass the cached response.
         """
-        return requests.get(
-            url=f"{self.base_url}/{author_id}",
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._get(self._by_id.format(author_id), headers, fresh)
 
     def add_author(self, author_data, headers=None):
         """
         Adds a new author to the API.
         """
-        return requests.post(
-            url=self.base_url,
-            json=author_data,
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._write("POST", self.base_url, author_data, headers)
 
     def update_author(self, author_id, author_data, headers=None):
         """
         Updates an existing author in the API.
         """
-        return requests.put(
-            url=f"{self.base_url}/{author_id}",
-            json=author_data,
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._write("PUT", self._by_id.format(author_id), author_data, headers)
 
     def delete_author(self, author_id, headers=None):
         """
         Deletes an author from the API.
         """
-        return requests.delete(
-            url=f"{self.base_url}/{author_id}",
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._write("DELETE", self._by_id.format(author_id), headers=headers)
 
     def wrong_method(self, method_name, author_id=None, headers=None):
         """
         A method that demonstrates an incorrect API call.
+        Callers only check the status code, the response body is not parsed.
         """
         url = self.base_url
         if author_id is not None:
-            url = f"{self.base_url}/{author_id}"
-        return requests.request(
-            method_name,
-            url,
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+            url = self._by_id.format(author_id)
+        return self._request(method_name, url, headers=headers)
 
-    def get_authors_by_book_id(self, id_book, headers=None):
+    def get_authors_by_book_id(self, id_book, headers=None, fresh=False):
         """
         Fetches all authors associated with a given book ID.
+        Pass fresh=True to bypass the cached response.
         """
-        return requests.get(
-            url=f"{self.base_url}/authors/books/{id_book}",
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._get(self._by_book.format(id_book), headers, fresh)
 
     def get_authors_by_book_id_wrong_method(self, method_name, id_book, headers=None):
         """
         A method that demonstrates an incorrect API call for fetching authors by book ID.
+        Callers only check the status code, the response body is not parsed.
         """
-        url = f"{self.base_url}/authors/books/{id_book}"
-        return requests.request(
-            method_name,
-            url,
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._request(method_name, self._by_book.format(id_book), headers=headers)
@@ -3,7 +3,6 @@ API client for interacting with the Books endpoint of the online bookstore.
 This client provides methods to perform CRUD operations on books.
 """
 
-import requests
 from tests.api import common_api
 
 
@@ -18,70 +17,45 @@ class BooksAPI(common_api.CommonAPI):
         """
         Initializes the BooksAPI client with the base URL for the Books endpoint.
         """
-        super().__init__()
-        self.base_url = self._create_base_url("/api/v1/Books")
+        super().__init__("/api/v1/Books")
 
-    def get_books(self, headers=None):
+    def get_books(self, headers=None, fresh=False):
         """
         Fetches the list of all books from the API.
+        Pass fresh=True to bypass the cached response.
         Returns:
             Response: The response object containing the list of books.
         """
-        return requests.get(
-            url=self.base_url,
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._get(self.base_url, headers, fresh)
 
-    def get_book(self, book_id, headers=None):
+    def get_book(self, book_id, headers=None, fresh=False):
         """
         Fetches a single book by its ID from the API.
+        Pass fresh=True to bypass the cached response.
         """
-        return requests.get(
-            url=f"{self.base_url}/{book_id}",
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._get(self._by_id.format(book_id), headers, fresh)
 
     def add_book(self, book_data, headers=None):
         """
         Adds a new book to the API.
         """
-        return requests.post(
-            url=self.base_url,
-            json=book_data,
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._write("POST", self.base_url, book_data, headers)
 
     def update_book(self, book_id, book_data, headers=None):
         """
         Updates an existing book in the API.
         """
-        return requests.put(
-            url=f"{self.base_url}/{book_id}",
-            json=book_data,
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._write("PUT", self._by_id.format(book_id), book_data, headers)
 
     def delete_book(self, book_id, headers=None):
         """
         Deletes a book from the API.
         """
-        return requests.delete(
-            f"{self.base_url}/{book_id}",
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._write("DELETE", self._by_id.format(book_id), headers=headers)
 
     def wrong_method(self, method_name, book_id=None, headers=None):
         """
         A method that demonstrates an incorrect API call.
+        Callers only check the status code, the response body is not parsed.
         """
-        return requests.request(
-            method_name,
-            f"{self.base_url}/{book_id}",
-            timeout=self.timeout,
-            headers=headers or self.default_headers
-        )
+        return self._request(method_name, self._by_id.format(book_id), headers=headers)
@@ -1,22 +1,85 @@
 """
 CommonAPI class for API clients.
 This class provides a base implementation for API clients, including common functionality such as
-creating base URLs and handling default headers.
+creating base URLs, handling default headers and sharing a single HTTP session.
 """
 
-class CommonAPI: # pylint: disable=too-few-public-methods
+from weakref import WeakKeyDictionary
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _create_session():
+    """
+    Create the HTTP session shared by all API clients.
+    The session mounts an adapter with a larger connection pool and a small retry budget
+    for transient gateway errors.
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False  # return the last response so tests can assert on it
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+_JSON_CACHE = WeakKeyDictionary()  # response -> decoded body, dropped with the response
+
+
+def parse_json(response):
+    """
+    Parse the JSON body of a response with orjson.
+    The result is cached per response object, so responses shared between tests
+    (cached GETs, session fixtures) are decoded only once. Treat the result as read-only.
+    Args:
+        response: The response object from the API call.
+    Returns:
+        Any: The decoded JSON body.
+    """
+    try:
+        return _JSON_CACHE[response]
+    except KeyError:
+        data = _JSON_CACHE[response] = orjson.loads(response.content)
+        return data
+
+
+class CommonAPI:
     """
     Base class for API clients.
     This class provides a base implementation for API clients, including common functionality
     such as creating base URLs and handling default headers.
+    All clients share one requests.Session, so keep-alive connections are reused between calls.
     """
-    def __init__(self):
+    session = _create_session()
+
+    def __init__(self, api_path=""):
         """
         Initializes the CommonAPI instance with default settings.
+        Args:
+            api_path (str): The API path of the resource handled by the client.
         """
         self.hostname = "https://fakerestapi.azurewebsites.net/"
         self.timeout = 10  # seconds
+        # Accept-Encoding is left to requests: it advertises "br" when brotli is installed
+        # and only lists encodings that urllib3 can actually decode.
         self.default_headers = {"Content-Type": "application/json"}
+        self.session.headers.update(self.default_headers)
+        self.base_url = self._create_base_url(api_path)
+        self._by_id = self.base_url + "/{}"
+        self._get_cache = {}
 
     def _create_base_url(self, api_path=""):
         """
@@ -27,3 +90,82 @@ class CommonAPI: # pylint: disable=too-few-public-methods
             str: The complete base URL for the API.
         """
         return self.hostname + api_path
+
+    def _get(self, url, headers=None, fresh=False):
+        """
+        Send a GET request, reusing the cached response for the same URL when possible.
+        Only successful responses to requests without custom headers are cached, so a
+        transient error returned after the retries run out is not replayed to later callers.
+        Args:
+            url (str): The URL to fetch.
+            headers (dict, optional): Extra headers, merged over the session defaults.
+            fresh (bool): If True, bypass the cache and always hit the API.
+        Returns:
+            Response: The response object.
+        """
+        if headers is None and not fresh and url in self._get_cache:
+            return self._get_cache[url]
+        response = self.session.get(
+            url=url,
+            timeout=self.timeout,
+            headers=headers
+        )
+        if headers is None and response.ok:
+            self._get_cache[url] = response
+        return response
+
+    def _request(self, method, url, payload=None, headers=None):
+        """
+        Send a request through the shared session.
+        Args:
+            method (str): The HTTP method to use.
+            url (str): The URL to call.
+            payload (optional): The JSON body to send, if any.
+            headers (dict, optional): Extra headers, merged over the session defaults.
+        Returns:
+            Response: The response object.
+        """
+        return self.session.request(
+            method,
+            url,
+            data=None if payload is None else orjson.dumps(payload),
+            timeout=self.timeout,
+            headers=headers
+        )
+
+    def _write(self, method, url, payload=None, headers=None):
+        """
+        Send a request that modifies data and drop all cached GET responses.
+        Args:
+            method (str): The HTTP method to use.
+            url (str): The URL to call.
+            payload (optional): The JSON body to send, if any.
+            headers (dict, optional): Extra headers, merged over the session defaults.
+        Returns:
+            Response: The response object.
+        """
+        self._get_cache.clear()
+        return self._request(method, url, payload, headers)
+
+    @staticmethod
+    def discard(response):
+        """
+        Release a response whose body will not be inspected, e.g. after a 405 status check.
+        Args:
+            response: The response object from the API call.
+        """
+        response.close()
+
+    def close(self):
+        """
+        Drop the client's cached GET responses.
+        The shared session stays open for other clients; see close_session().
+        """
+        self._get_cache.clear()
+
+    @classmethod
+    def close_session(cls):
+        """
+        Close the shared session and release its pooled connections.
+        """
+        cls.session.close()
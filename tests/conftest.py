@@ -2,28 +2,83 @@
 Configuration file for pytest.
 This file sets up fixtures and configurations for the test suite.
 """
+# pylint: disable=redefined-outer-name  # fixtures depending on other fixtures
 
+from collections.abc import Iterator
 import pytest
-from tests.api import books_api, authors_api
+import requests
+from tests.api import books_api, authors_api, common_api
 
-@pytest.fixture
-def books_api_fixture() -> books_api.BooksAPI:
+
+@pytest.fixture(scope="session", autouse=True)
+def http_session_fixture():
+    """
+    Fixture to close the HTTP session shared by all API clients once the test session ends.
+    """
+    yield
+    common_api.CommonAPI.close_session()
+
+
+@pytest.fixture(scope="session")
+def books_api_fixture() -> Iterator[books_api.BooksAPI]:
     """
     Fixture to provide an instance of the BooksAPI client.
     This allows tests to interact with the Books API without needing to instantiate it in each test.
-    Returns:
+    One instance is shared by the whole test session; its GET cache is dropped at teardown.
+    Yields:
         BooksAPI: An instance of the BooksAPI client.
     """
-    return books_api.BooksAPI()
+    api = books_api.BooksAPI()
+    yield api
+    api.close()
 
 
-@pytest.fixture
-def authors_api_fixture() -> authors_api.AuthorsAPI:
+@pytest.fixture(scope="session")
+def authors_api_fixture() -> Iterator[authors_api.AuthorsAPI]:
     """
     Fixture to provide an instance of the AuthorsAPI client.
     This allows tests to interact with the Authors API without needing
     to instantiate it in each test.
-    Returns:
+    One instance is shared by the whole test session; its GET cache is dropped at teardown.
+    Yields:
         AuthorsAPI: An instance of the AuthorsAPI client.
     """
-    return authors_api.AuthorsAPI()
+    api = authors_api.AuthorsAPI()
+    yield api
+    api.close()
+
+
+@pytest.fixture(scope="session")
+def author_1_response(authors_api_fixture: authors_api.AuthorsAPI) -> requests.Response:
+    """
+    Fixture to provide the response of GET /Authors/1, fetched once per test session.
+    Returns:
+        Response: The response object for the author with ID 1.
+    """
+    return authors_api_fixture.get_author(1)
+
+
+@pytest.fixture(scope="session")
+def all_authors(authors_api_fixture: authors_api.AuthorsAPI) -> requests.Response:
+    """
+    Fixture to provide the response of GET /Authors, fetched once per test session
+    and shared by the read-only tests of the authors list.
+    Returns:
+        Response: The response object containing the list of authors.
+    """
+    response = authors_api_fixture.get_authors()
+    response.raise_for_status()
+    return response
+
+
+@pytest.fixture(scope="session")
+def all_books(books_api_fixture: books_api.BooksAPI) -> requests.Response:
+    """
+    Fixture to provide the response of GET /Books, fetched once per test session
+    and shared by the read-only tests of the books list.
+    Returns:
+        Response: The response object containing the list of books.
+    """
+    response = books_api_fixture.get_books()
+    response.raise_for_status()
+    return response
@@ -2,100 +2,99 @@
 Tests for the /Authors endpoint of the online bookstore API.
 """
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 import pytest
+import requests
 from tests.schemas import authors_schema, common_schemas
 from tests.models import authors_model, common_models
-from tests.api import authors_api
+from tests.api import authors_api, common_api
 from tests.utils import response_validators, data_generators
-
-# --- Helpers & Constants ---
-
-AUTHOR_ID_AS_STRING = ["abc", "123abc", None, " "] # Invalid author IDs that are not integers
-AUTHOR_ID_NOT_VALID_INT = [-1, 0] # Invalid author IDs that are not positive integers
-AUTHOR_NULLABLE_FIELDS = ["firstName", "lastName"] # Fields that can be omitted in POST/PUT requests
-AUTHOR_BAD_VALUES = [ # Invalid values for required fields in POST/PUT requests
-    ("id", "string_instead_of_int"),
-    ("idBook", "string_instead_of_int"),
-    ("firstName", 12345),
-    ("lastName", 12345),
-]
-AUTHOR_WRONG_METHODS = ["PATCH"] # Methods that should not be allowed on /Authors endpoint
-# These methods should return 405 Method Not Allowed
-
-AUTHOR_BOOKS_ID_AS_STRING = ["abc", "123abc", None, " "] # Invalid book IDs that are not integers
-AUTHOR_BOOKS_WRONG_METHODS = [
-    "POST",
-    "PUT",
-    "DELETE",
-    "PATCH"
-] # Methods that should not be allowed on /Authors/{id}/Books endpoint
+from tests._params import (
+    AUTHOR_ID_AS_STRING,
+    AUTHOR_ID_AS_STRING_IDS,
+    AUTHOR_ID_NOT_VALID_INT,
+    AUTHOR_ID_NOT_VALID_INT_IDS,
+    AUTHOR_NULLABLE_FIELDS,
+    AUTHOR_NULLABLE_FIELDS_IDS,
+    AUTHOR_BAD_VALUES,
+    AUTHOR_BAD_VALUES_IDS,
+    AUTHOR_WRONG_METHODS,
+    AUTHOR_WRONG_METHODS_IDS,
+    AUTHOR_BOOKS_ID_AS_STRING,
+    AUTHOR_BOOKS_ID_AS_STRING_IDS,
+    AUTHOR_BOOKS_WRONG_METHODS,
+    AUTHOR_BOOKS_WRONG_METHODS_IDS,
+)
 
 
 # --- Tests for GET /Authors Endpoint (list) ---
 
-def test_get_authors_validates_all_items(authors_api_fixture: authors_api.AuthorsAPI):
+def test_get_authors_validates_all_items(all_authors: requests.Response):
     """
     Tests that the API returns a list of authors with valid schema and model.
     This test checks that each author in the list conforms to the expected schema and model."""
-    response = authors_api_fixture.get_authors()
+    response = all_authors
     response_validators.assert_status_code(response, 200)
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
 
-    authors = response.json()
+    authors = common_api.parse_json(response)
     assert isinstance(authors, list), f"Expected list, got {type(authors)}"
     assert authors, "Authors list is empty"
 
-    for idx, item in enumerate(authors):
-        response_validators.validate_schema_and_model(
-            item,
-            authors_schema.AUTHOR_SCHEMA,
-            authors_model.Author,
-            idx
-        )
+    response_validators.validate_list_schema_and_model(
+        authors,
+        authors_schema.AUTHOR_SCHEMA,
+        authors_model.Author
+    )
 
 
-def test_get_authors_ids_are_unique(authors_api_fixture: authors_api.AuthorsAPI):
+def test_get_authors_ids_are_unique(all_authors: requests.Response):
     """
     Tests that the API returns a list of authors with unique IDs.
     """
-    response = authors_api_fixture.get_authors()
-    authors = response.json()
-    ids = [a["id"] for a in authors]
-    assert len(ids) == len(set(ids)), "Duplicate IDs found in authors list"
+    authors = common_api.parse_json(all_authors)
+    seen = set()
+    for author in authors:
+        author_id = author["id"]
+        assert author_id not in seen, f"Duplicate ID {author_id} found in authors list"
+        seen.add(author_id)
 
 
-def test_get_authors_no_full_duplicates(authors_api_fixture: authors_api.AuthorsAPI):
+def test_get_authors_no_full_duplicates(all_authors: requests.Response):
     """
     Tests that the API does not return full duplicate author objects.
     """
-    resp = authors_api_fixture.get_authors()
-    authors = [json.dumps(a, sort_keys=True) for a in resp.json()]
-    assert len(authors) == len(set(authors)), "Full author object duplicate found"
+    seen = set()
+    for author in common_api.parse_json(all_authors):
+        key = tuple(sorted(author.items()))  # author fields are flat, hashable values
+        assert key not in seen, f"Full author object duplicate found: {author}"
+        seen.add(key)
 
 
-@pytest.mark.parametrize("method", AUTHOR_WRONG_METHODS)
+@pytest.mark.parametrize("method", AUTHOR_WRONG_METHODS, ids=AUTHOR_WRONG_METHODS_IDS)
 def test_authors_wrong_method(authors_api_fixture: authors_api.AuthorsAPI, method):
     """
     Tests that the API returns a 405 Method Not Allowed for incorrect methods on /Authors.
     """
     response = authors_api_fixture.wrong_method(method)
     response_validators.assert_status_code(response, 405)
+    authors_api_fixture.discard(response)
 
 
 # --- Tests for GET /Authors/{id} Endpoint (single author) ---
 
-def test_get_author_by_id_happy_path(authors_api_fixture: authors_api.AuthorsAPI):
+@pytest.mark.xdist_group("author_1")
+def test_get_author_by_id_happy_path(author_1_response: requests.Response):
     """
     Tests the happy path for fetching an author by ID.
     """
-    response = authors_api_fixture.get_author(1)
+    response = author_1_response
     response_validators.assert_status_code(response, 200)
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         authors_schema.AUTHOR_SCHEMA,
         authors_model.Author,
     )
@@ -113,7 +112,7 @@ def test_get_author_by_id_not_found(authors_api_fixture: authors_api.AuthorsAPI)
     response_validators.assert_api_version(response, "1.0")
 
 
-@pytest.mark.parametrize("author_id", AUTHOR_ID_NOT_VALID_INT)
+@pytest.mark.parametrize("author_id", AUTHOR_ID_NOT_VALID_INT, ids=AUTHOR_ID_NOT_VALID_INT_IDS)
 def test_get_author_by_id_edge_cases_int_404(
     authors_api_fixture: authors_api.AuthorsAPI,
     author_id
@@ -129,31 +128,37 @@ def test_get_author_by_id_edge_cases_int_404(
     )
     response_validators.assert_api_version(response, "1.0")
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         common_schemas.ERROR_404_SCHEMA,
         common_models.Error404Response
     )
 
 
-@pytest.mark.parametrize("author_id", AUTHOR_ID_AS_STRING)
-def test_get_author_by_id_edge_cases_str_400(
-    authors_api_fixture: authors_api.AuthorsAPI,
-    author_id
-):
+def test_get_author_by_id_edge_cases_str_400(authors_api_fixture: authors_api.AuthorsAPI):
     """
     Tests that GET /Authors/{id} returns 400 Bad Request for invalid author ID formats.
-    """
-    response = authors_api_fixture.get_author(author_id)
-    response_validators.assert_status_code(response, 400)
-    response_validators.assert_json_content_type(
-        response,
-        "application/problem+json; charset=utf-8"
-    )
-    response_validators.validate_schema_and_model(
-        response.json(),
-        common_schemas.ERROR_400_SCHEMA,
-        common_models.Error400Response
-    )
+    All invalid IDs are requested concurrently over the shared session; failures are collected
+    per ID and reported together.
+    """
+    with ThreadPoolExecutor(max_workers=len(AUTHOR_ID_AS_STRING)) as executor:
+        responses = list(executor.map(authors_api_fixture.get_author, AUTHOR_ID_AS_STRING))
+
+    failures = []
+    for author_id, response in zip(AUTHOR_ID_AS_STRING, responses):
+        try:
+            response_validators.assert_status_code(response, 400)
+            response_validators.assert_json_content_type(
+                response,
+                "application/problem+json; charset=utf-8"
+            )
+            response_validators.validate_schema_and_model(
+                common_api.parse_json(response),
+                common_schemas.ERROR_400_SCHEMA,
+                common_models.Error400Response
+            )
+        except (AssertionError, pytest.fail.Exception) as e:
+            failures.append(f"author_id={author_id!r}: {e}")
+    assert not failures, "\n".join(failures)
 
 # --- Tests for POST /Authors Endpoint (add author) ---
 
@@ -167,12 +172,12 @@ def test_post_author_happy_path(authors_api_fixture: authors_api.AuthorsAPI):
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         authors_schema.AUTHOR_SCHEMA,
         authors_model.Author
     )
 
-@pytest.mark.parametrize("nullable_field", AUTHOR_NULLABLE_FIELDS)
+@pytest.mark.parametrize("nullable_field", AUTHOR_NULLABLE_FIELDS, ids=AUTHOR_NULLABLE_FIELDS_IDS)
 def test_post_author_happy_path_with_nullable_fields(
     authors_api_fixture: authors_api.AuthorsAPI,
     nullable_field
@@ -180,24 +185,24 @@ def test_post_author_happy_path_with_nullable_fields(
     """
     Tests that POST /Authors accepts requests with nullable fields omitted.
     """
-    author = data_generators.build_author()
+    author = dict(data_generators.build_author_template())
     author.pop(nullable_field)
     response = authors_api_fixture.add_author(author)
     response_validators.assert_status_code(response, 200)
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         authors_schema.AUTHOR_SCHEMA,
         authors_model.Author
     )
 
-@pytest.mark.parametrize("field,bad_value", AUTHOR_BAD_VALUES)
+@pytest.mark.parametrize("field,bad_value", AUTHOR_BAD_VALUES, ids=AUTHOR_BAD_VALUES_IDS)
 def test_post_author_400_invalid_type_for_required_fields(authors_api_fixture, field, bad_value):
     """
     Tests that POST /Authors rejects requests with invalid type for required, non-null fields.
     """
-    author = data_generators.build_author()
+    author = dict(data_generators.build_author_template())
     author[field] = bad_value
     response = authors_api_fixture.add_author(author)
     response_validators.assert_status_code(response, 400)
@@ -206,13 +211,14 @@ def test_post_author_400_invalid_type_for_required_fields(authors_api_fixture, f
         "application/problem+json; charset=utf-8"
     )
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         common_schemas.ERROR_400_SCHEMA,
         common_models.Error400Response
     )
 
 # --- Tests for PUT /Authors/{id} Endpoint (update author) ---
 
+@pytest.mark.xdist_group("author_1")
 def test_put_author_happy_path(authors_api_fixture: authors_api.AuthorsAPI):
     """
     Tests the happy path for updating an author by ID.
@@ -223,12 +229,12 @@ def test_put_author_happy_path(authors_api_fixture: authors_api.AuthorsAPI):
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         authors_schema.AUTHOR_SCHEMA,
         authors_model.Author
     )
 
-@pytest.mark.parametrize("author_id", AUTHOR_ID_AS_STRING)
+@pytest.mark.parametrize("author_id", AUTHOR_ID_AS_STRING, ids=AUTHOR_ID_AS_STRING_IDS)
 def test_put_author_by_id_edge_cases_str_400(
     authors_api_fixture: authors_api.AuthorsAPI,
     author_id
@@ -243,12 +249,13 @@ def test_put_author_by_id_edge_cases_str_400(
         response, "application/problem+json; charset=utf-8"
     )
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         common_schemas.ERROR_400_SCHEMA,
         common_models.Error400Response
     )
 
-@pytest.mark.parametrize("nullable_field", AUTHOR_NULLABLE_FIELDS)
+@pytest.mark.xdist_group("author_1")
+@pytest.mark.parametrize("nullable_field", AUTHOR_NULLABLE_FIELDS, ids=AUTHOR_NULLABLE_FIELDS_IDS)
 def test_put_author_happy_path_with_nullable_fields(
     authors_api_fixture: authors_api.AuthorsAPI,
     nullable_field
@@ -256,19 +263,19 @@ def test_put_author_happy_path_with_nullable_fields(
     """
     Tests that PUT /Authors/{id} accepts requests with nullable fields omitted.
     """
-    author = data_generators.build_author()
+    author = dict(data_generators.build_author_template())
     author.pop(nullable_field)
     response = authors_api_fixture.update_author(1, author)
     response_validators.assert_status_code(response, 200)
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         authors_schema.AUTHOR_SCHEMA,
         authors_model.Author
     )
 
-@pytest.mark.parametrize("field,bad_value", AUTHOR_BAD_VALUES)
+@pytest.mark.parametrize("field,bad_value", AUTHOR_BAD_VALUES, ids=AUTHOR_BAD_VALUES_IDS)
 def test_put_author_400_invalid_type_for_required_fields(
     authors_api_fixture: authors_api.AuthorsAPI,
     field, bad_value
@@ -277,7 +284,7 @@ def test_put_author_400_invalid_type_for_required_fields(
     Tests that PUT /Authors/{id} rejects requests with invalid type for required,
     non-null fields.
     """
-    author = data_generators.build_author()
+    author = dict(data_generators.build_author_template())
     author[field] = bad_value
     response = authors_api_fixture.update_author(1, author)
     response_validators.assert_status_code(response, 400)
@@ -285,7 +292,7 @@ def test_put_author_400_invalid_type_for_required_fields(
         response, "application/problem+json; charset=utf-8"
     )
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         common_schemas.ERROR_400_SCHEMA,
         common_models.Error400Response
     )
@@ -293,6 +300,7 @@ def test_put_author_400_invalid_type_for_required_fields(
 
 # --- Tests for DELETE /Authors/{id} Endpoint (delete author) ---
 
+@pytest.mark.xdist_group("author_1")
 def test_delete_author_happy_path(authors_api_fixture: authors_api.AuthorsAPI):
     """
     Tests the happy path for deleting an author by ID.
@@ -300,10 +308,10 @@ def test_delete_author_happy_path(authors_api_fixture: authors_api.AuthorsAPI):
     response = authors_api_fixture.delete_author(1)
     response_validators.assert_status_code(response, 200)
     response_validators.assert_header_present(response, "api-supported-versions")
-    assert response.content == b'', "Expected no content in response body after deletion"
+    response_validators.assert_empty_body(response)
 
 
-@pytest.mark.parametrize("author_id", AUTHOR_ID_AS_STRING)
+@pytest.mark.parametrize("author_id", AUTHOR_ID_AS_STRING, ids=AUTHOR_ID_AS_STRING_IDS)
 def test_delete_author_by_id_edge_cases_str_400(
     authors_api_fixture: authors_api.AuthorsAPI,
     author_id
@@ -317,7 +325,7 @@ def test_delete_author_by_id_edge_cases_str_400(
         response, "application/problem+json; charset=utf-8"
     )
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         common_schemas.ERROR_400_SCHEMA,
         common_models.Error400Response
     )
@@ -334,17 +342,15 @@ def test_get_authors_by_book_id_happy_path(authors_api_fixture: authors_api.Auth
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
 
-    authors = response.json()
+    authors = common_api.parse_json(response)
     assert isinstance(authors, list), f"Expected list, got {type(authors)}"
     assert authors, "Authors list is empty"
 
-    for idx, item in enumerate(authors):
-        response_validators.validate_schema_and_model(
-            item,
-            authors_schema.AUTHOR_SCHEMA,
-            authors_model.Author,
-            idx
-        )
+    response_validators.validate_list_schema_and_model(
+        authors,
+        authors_schema.AUTHOR_SCHEMA,
+        authors_model.Author
+    )
 
 def test_get_authors_by_book_id_empty_list(authors_api_fixture: authors_api.AuthorsAPI):
     """
@@ -355,12 +361,12 @@ def test_get_authors_by_book_id_empty_list(authors_api_fixture: authors_api.Auth
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
 
-    authors = response.json()
+    authors = common_api.parse_json(response)
     assert isinstance(authors, list), f"Expected list, got {type(authors)}"
     assert not authors, "Expected empty list for non-existent book ID"
 
 
-@pytest.mark.parametrize("book_id", AUTHOR_BOOKS_ID_AS_STRING)
+@pytest.mark.parametrize("book_id", AUTHOR_BOOKS_ID_AS_STRING, ids=AUTHOR_BOOKS_ID_AS_STRING_IDS)
 def test_get_authors_by_book_id_edge_cases_str_400(
     authors_api_fixture: authors_api.AuthorsAPI,
     book_id
@@ -375,12 +381,12 @@ def test_get_authors_by_book_id_edge_cases_str_400(
         "application/problem+json; charset=utf-8"
     )
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         common_schemas.ERROR_400_SCHEMA,
         common_models.Error400Response
     )
 
-@pytest.mark.parametrize("method", AUTHOR_BOOKS_WRONG_METHODS)
+@pytest.mark.parametrize("method", AUTHOR_BOOKS_WRONG_METHODS, ids=AUTHOR_BOOKS_WRONG_METHODS_IDS)
 def test_authors_books_wrong_method(authors_api_fixture: authors_api.AuthorsAPI, method):
     """
     Tests that the API returns a 405 Method Not Allowed
@@ -388,3 +394,4 @@ def test_authors_books_wrong_method(authors_api_fixture: authors_api.AuthorsAPI,
     """
     response = authors_api_fixture.get_authors_by_book_id_wrong_method(method, 1)
     response_validators.assert_status_code(response, 405)
+    authors_api_fixture.discard(response)
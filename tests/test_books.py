@@ -3,92 +3,99 @@ Tests for the GET /Books endpoint of the online bookstore API.
 These tests validate the structure and uniqueness of book items returned by the API.
 """
 
-import json
+from operator import itemgetter
 import pytest
+import requests
 from tests.schemas import book_schema, common_schemas
 from tests.models import book_model, common_models
-from tests.api import books_api
+from tests.api import books_api, common_api
 from tests.utils import response_validators, data_generators
+from tests._params import (
+    BOOK_ID_AS_STRING,
+    BOOK_ID_AS_STRING_IDS,
+    BOOK_ID_NOT_VALID_INT,
+    BOOK_ID_NOT_VALID_INT_IDS,
+    BOOK_NULLABLE_FIELDS,
+    BOOK_NULLABLE_FIELDS_IDS,
+    BOOK_BAD_VALUES,
+    BOOK_BAD_VALUES_IDS,
+    BOOK_WRONG_METHODS,
+    BOOK_WRONG_METHODS_IDS,
+)
 
 
 # --- Helpers & Constants ---
 
-BOOK_ID_AS_STRING = ["abc", "123abc", None, " "] # Invalid book IDs that are not integers.
-# These should return 400 Bad Request when used in GET /Books/{id} or POST /Books/{id} endpoints.
-# They are not valid integers and should be handled by the API.
-
-BOOK_ID_NOT_VALID_INT = [-1, 0] # Invalid book IDs that are not positive integers.
-# These should return 404 Not Found when used in GET /Books/{id} endpoint.
-
-BOOK_NULLABLE_FIELDS = [
-    "title",
-    "description",
-    "excerpt"
-]  # Fields that can be nullable in the book model.
-# These fields can be omitted when creating or updating a book,
-# and the API should handle them gracefully.
-# Bad values for required fields that should return 400 Bad Request
-# when used in POST or PUT requests.
-
-BOOK_BAD_VALUES = [ # Invalid values for required fields that should return 400 Bad Request
-    # when used in POST or PUT requests.
-    # These values are not of the expected type or format for the respective fields.
-    # Each tuple contains the field name and a bad value that should trigger a validation error.
-    ("id", "string_instead_of_int"),
-    ("pageCount", "string_instead_of_int"),
-    ("publishDate", 12345),  # not a valid date (normally expects string in ISO format)
-    ("publishDate", "not-a-date"), # not a valid date
-    ("publishDate", "2025-13-01"), # not a valid date
-    ("publishDate", "2025-02-30"), # not a valid date
-    ("publishDate", "01-01-2025"), # not a valid date
-]
+# Expected error responses: (status, content type, API version or None, schema, model)
+ERROR_404_EXPECTED = (
+    404,
+    "application/problem+json; charset=utf-8; v=1.0",
+    "1.0",
+    common_schemas.ERROR_404_SCHEMA,
+    common_models.Error404Response
+)
+ERROR_400_EXPECTED = (
+    400,
+    "application/problem+json; charset=utf-8",
+    None,  # API version header is not checked for 400 responses
+    common_schemas.ERROR_400_SCHEMA,
+    common_models.Error400Response
+)
+BOOK_GET_ERROR_CASES = ( # Book IDs for GET /Books/{id} paired with the expected error response
+    ((99999, ERROR_404_EXPECTED),)
+    + tuple((book_id, ERROR_404_EXPECTED) for book_id in BOOK_ID_NOT_VALID_INT)
+    + tuple((book_id, ERROR_400_EXPECTED) for book_id in BOOK_ID_AS_STRING)
+)
+BOOK_GET_ERROR_CASES_IDS = ("not_found",) + BOOK_ID_NOT_VALID_INT_IDS + BOOK_ID_AS_STRING_IDS
 
 # --- Tests for GET /Books Endpoint (list) ---
 
-def test_get_books_validates_all_items(books_api_fixture: books_api.BooksAPI):
+def test_get_books_validates_all_items(all_books: requests.Response):
     """
     Test to ensure that all items in the GET /Books response
     conform to the expected JSON Schema and Pydantic model.
     This checks both the structure and data types of each book item.
     """
-    response = books_api_fixture.get_books()
+    response = all_books
     response_validators.assert_status_code(response, 200)
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
 
-    books = response.json()
+    books = common_api.parse_json(response)
     assert isinstance(books, list), f"Expected list, got {type(books)}"
     assert books, "Books list is empty"
 
-    for idx, item in enumerate(books):
-        response_validators.validate_schema_and_model(
-            item,
-            book_schema.BOOK_SCHEMA,
-            book_model.Book,
-            idx
-        )
+    response_validators.validate_list_schema_and_model(
+        books,
+        book_schema.BOOK_SCHEMA,
+        book_model.Book
+    )
 
 
-def test_get_books_ids_are_unique(books_api_fixture: books_api.BooksAPI):
+def test_get_books_ids_are_unique(all_books: requests.Response):
     """
     Test to ensure that all book IDs in the GET /Books response are unique.
     This checks for duplicate IDs in the list of books returned by the API.
     """
-    response = books_api_fixture.get_books()
-    books = response.json()
-    ids = [b["id"] for b in books]
-    assert len(ids) == len(set(ids)), "Duplicate IDs found in books list"
+    books = common_api.parse_json(all_books)
+    seen = set()
+    for book in books:
+        book_id = book["id"]
+        assert book_id not in seen, f"Duplicate ID {book_id} found in books list"
+        seen.add(book_id)
 
 
-def test_get_books_no_full_duplicates(books_api_fixture: books_api.BooksAPI):
+def test_get_books_no_full_duplicates(all_books: requests.Response):
     """
     Test to ensure that no two books in the GET /Books response
     are identical in all fields.
     This checks for full object duplicates in the list of books returned by the API.
     """
-    resp = books_api_fixture.get_books()
-    books = [json.dumps(b, sort_keys=True) for b in resp.json()]
-    assert len(books) == len(set(books)), "Full book object duplicate found"
+    seen = set()
+    for book in common_api.parse_json(all_books):
+        key = tuple(sorted(book.items()))  # book fields are flat, hashable values
+        assert key not in seen, f"Full book object duplicate found: {book}"
+        seen.add(key)
 
 
 # NOTE:
@@ -102,16 +109,17 @@ def test_get_books_is_idempotent(books_api_fixture: books_api.BooksAPI):
     Test to ensure that multiple calls to GET /Books return the same set of books.
     This checks for idempotency by comparing the IDs of books returned in multiple calls.
     """
-    first = books_api_fixture.get_books().json()
-    second = books_api_fixture.get_books().json()
+    first = common_api.parse_json(books_api_fixture.get_books(fresh=True))
+    second = common_api.parse_json(books_api_fixture.get_books(fresh=True))
     # Check only the IDs and length of the lists
-    first_ids = [b["id"] for b in first]
-    second_ids = [b["id"] for b in second]
-    assert first_ids == second_ids, "IDs returned by GET /Books are not idempotent"
+    get_id = itemgetter("id")
+    assert list(map(get_id, first)) == list(map(get_id, second)), (
+        "IDs returned by GET /Books are not idempotent"
+    )
     assert len(first) == len(second), "GET /Books returned different number of items"
 
 
-@pytest.mark.parametrize("method", ["PATCH"])
+@pytest.mark.parametrize("method", BOOK_WRONG_METHODS, ids=BOOK_WRONG_METHODS_IDS)
 def test_get_books_wrong_method(books_api_fixture: books_api.BooksAPI, method):
     """
     Test to ensure that using an incorrect HTTP method (e.g., POST) on GET /Books
@@ -120,10 +128,12 @@ def test_get_books_wrong_method(books_api_fixture: books_api.BooksAPI, method):
     """
     response = books_api_fixture.wrong_method(method)
     response_validators.assert_status_code(response, 405)
+    books_api_fixture.discard(response)
 
 
 # --- Tests for GET /Books/{id} Endpoint (single book) ---
 
+@pytest.mark.xdist_group("book_1")
 def test_get_book_by_id_happy_path(books_api_fixture: books_api.BooksAPI):
     """
     GET /Books/{id} should return a book by its ID and validate the response.
@@ -134,60 +144,29 @@ def test_get_book_by_id_happy_path(books_api_fixture: books_api.BooksAPI):
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         book_schema.BOOK_SCHEMA,
         book_model.Book,
     )
 
 
-def test_get_book_by_id_not_found(books_api_fixture: books_api.BooksAPI):
-    """
-    GET /Books/{id} should return 404 Not Found for a book ID that does not exist.
-    This checks the API's response when trying to retrieve a book that is not present.
-    """
-    response = books_api_fixture.get_book(99999)
-    response_validators.assert_status_code(response, 404)
-    response_validators.assert_json_content_type(
-        response,
-        "application/problem+json; charset=utf-8; v=1.0"
-    )
-    response_validators.assert_api_version(response, "1.0")
-
-
-@pytest.mark.parametrize("book_id", BOOK_ID_NOT_VALID_INT)
-def test_get_book_by_id_edge_cases_int_404(books_api_fixture: books_api.BooksAPI, book_id):
-    """
-    GET /Books/{id} should return 404 Not Found for invalid book IDs (e.g., 0 or negative).
-    """
-    response = books_api_fixture.get_book(book_id)
-    response_validators.assert_status_code(response, 404)
-    response_validators.assert_json_content_type(
-        response,
-        "application/problem+json; charset=utf-8; v=1.0"
-    )
-    response_validators.assert_api_version(response, "1.0")
-    response_validators.validate_schema_and_model(
-        response.json(),
-        common_schemas.ERROR_404_SCHEMA,
-        common_models.Error404Response
-    )
-
-
-@pytest.mark.parametrize("book_id", BOOK_ID_AS_STRING)
-def test_get_book_by_id_edge_cases_str_400(books_api_fixture: books_api.BooksAPI, book_id):
+@pytest.mark.parametrize("book_id,expected", BOOK_GET_ERROR_CASES, ids=BOOK_GET_ERROR_CASES_IDS)
+def test_get_book_by_id_errors(books_api_fixture: books_api.BooksAPI, book_id, expected):
     """
-    GET /Books/{id} should return 400 Bad Request for invalid book IDs.
+    GET /Books/{id} should return 404 Not Found for non-existent or non-positive book IDs
+    and 400 Bad Request for book IDs that are not integers.
+    The error body is validated against the matching schema and model.
     """
+    status, content_type, api_version, schema, model = expected
     response = books_api_fixture.get_book(book_id)
-    response_validators.assert_status_code(response, 400)
-    response_validators.assert_json_content_type(
-        response,
-        "application/problem+json; charset=utf-8"
-    )
+    response_validators.assert_status_code(response, status)
+    response_validators.assert_json_content_type(response, content_type)
+    if api_version is not None:
+        response_validators.assert_api_version(response, api_version)
     response_validators.validate_schema_and_model(
-        response.json(),
-        common_schemas.ERROR_400_SCHEMA,
-        common_models.Error400Response
+        common_api.parse_json(response),
+        schema,
+        model
     )
 
 
@@ -203,13 +182,13 @@ def test_post_book_happy_path(books_api_fixture: books_api.BooksAPI):
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         book_schema.BOOK_SCHEMA,
         book_model.Book
     )
 
 
-@pytest.mark.parametrize("nullable_field", BOOK_NULLABLE_FIELDS)
+@pytest.mark.parametrize("nullable_field", BOOK_NULLABLE_FIELDS, ids=BOOK_NULLABLE_FIELDS_IDS)
 def test_post_book_happy_path_with_nullable_fields(
     books_api_fixture: books_api.BooksAPI,
     nullable_field
@@ -217,27 +196,25 @@ def test_post_book_happy_path_with_nullable_fields(
     """
     POST /Books should allow adding a book with nullable fields removed.
     """
-    book = data_generators.build_book()
+    book = dict(data_generators.build_book_template())
     book.pop(nullable_field)
     response = books_api_fixture.add_book(book)
     response_validators.assert_status_code(response, 200)
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         book_schema.BOOK_SCHEMA,
         book_model.Book
     )
 
 
-@pytest.mark.parametrize(
-    "field,bad_value", BOOK_BAD_VALUES
-)
+@pytest.mark.parametrize("field,bad_value", BOOK_BAD_VALUES, ids=BOOK_BAD_VALUES_IDS)
 def test_post_book_400_invalid_type_for_required_fields(books_api_fixture, field, bad_value):
     """
     POST /Books should reject requests with invalid type for required, non-nullable fields.
     """
-    book = data_generators.build_book()
+    book = dict(data_generators.build_book_template())
     book[field] = bad_value
     response = books_api_fixture.add_book(book)
     response_validators.assert_status_code(response, 400)
@@ -246,7 +223,7 @@ def test_post_book_400_invalid_type_for_required_fields(books_api_fixture, field
         "application/problem+json; charset=utf-8"
     )
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         common_schemas.ERROR_400_SCHEMA,
         common_models.Error400Response
     )
@@ -254,6 +231,7 @@ def test_post_book_400_invalid_type_for_required_fields(books_api_fixture, field
 
 # --- Tests for PUT /Books/{id} Endpoint (update book) ---
 
+@pytest.mark.xdist_group("book_1")
 def test_put_book_happy_path(books_api_fixture: books_api.BooksAPI):
     """
     Test to ensure that updating a book by ID returns the updated book data.
@@ -264,12 +242,12 @@ def test_put_book_happy_path(books_api_fixture: books_api.BooksAPI):
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         book_schema.BOOK_SCHEMA,
         book_model.Book
     )
 
-@pytest.mark.parametrize("book_id", BOOK_ID_AS_STRING)
+@pytest.mark.parametrize("book_id", BOOK_ID_AS_STRING, ids=BOOK_ID_AS_STRING_IDS)
 def test_put_book_by_id_edge_cases_str_400(books_api_fixture: books_api.BooksAPI, book_id):
     """
     PUT /Books/{id} should return 400 Bad Request for invalid book IDs.
@@ -282,13 +260,14 @@ def test_put_book_by_id_edge_cases_str_400(books_api_fixture: books_api.BooksAPI
         "application/problem+json; charset=utf-8"
     )
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         common_schemas.ERROR_400_SCHEMA,
         common_models.Error400Response
     )
 
 
-@pytest.mark.parametrize("nullable_field", BOOK_NULLABLE_FIELDS)
+@pytest.mark.xdist_group("book_1")
+@pytest.mark.parametrize("nullable_field", BOOK_NULLABLE_FIELDS, ids=BOOK_NULLABLE_FIELDS_IDS)
 def test_put_book_happy_path_with_nullable_fields(
     books_api_fixture: books_api.BooksAPI,
     nullable_field
@@ -296,22 +275,20 @@ def test_put_book_happy_path_with_nullable_fields(
     """
     PUT /Books/{id} should allow updating a book with nullable fields removed.
     """
-    book = data_generators.build_book()
+    book = dict(data_generators.build_book_template())
     book.pop(nullable_field)
     response = books_api_fixture.update_book(1, book)
     response_validators.assert_status_code(response, 200)
     response_validators.assert_json_content_type(response)
     response_validators.assert_api_version(response, "1.0")
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         book_schema.BOOK_SCHEMA,
         book_model.Book
     )
 
 
-@pytest.mark.parametrize(
-    "field,bad_value", BOOK_BAD_VALUES
-)
+@pytest.mark.parametrize("field,bad_value", BOOK_BAD_VALUES, ids=BOOK_BAD_VALUES_IDS)
 def test_put_book_400_invalid_type_for_required_fields(
     books_api_fixture: books_api.BooksAPI,
     field,
@@ -320,7 +297,7 @@ def test_put_book_400_invalid_type_for_required_fields(
     """
     PUT /Books/{id} should reject requests with invalid type for required, non-nullable fields.
     """
-    book = data_generators.build_book()
+    book = dict(data_generators.build_book_template())
     book[field] = bad_value
     response = books_api_fixture.update_book(1, book)
     response_validators.assert_status_code(response, 400)
@@ -329,7 +306,7 @@ def test_put_book_400_invalid_type_for_required_fields(
         "application/problem+json; charset=utf-8"
     )
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         common_schemas.ERROR_400_SCHEMA,
         common_models.Error400Response
     )
@@ -337,6 +314,7 @@ def test_put_book_400_invalid_type_for_required_fields(
 
 # --- Tests for DELETE /Books/{id} Endpoint (delete book) ---
 
+@pytest.mark.xdist_group("book_1")
 def test_delete_book_happy_path(books_api_fixture: books_api.BooksAPI):
     """
     Test to ensure that deleting a book by ID returns a 204 No Content status code.
@@ -345,10 +323,10 @@ def test_delete_book_happy_path(books_api_fixture: books_api.BooksAPI):
     response = books_api_fixture.delete_book(1)
     response_validators.assert_status_code(response, 200)
     response_validators.assert_header_present(response, "api-supported-versions")
-    assert response.content == b'', "Expected no content in response body after deletion"
+    response_validators.assert_empty_body(response)
 
 
-@pytest.mark.parametrize("book_id", BOOK_ID_AS_STRING)
+@pytest.mark.parametrize("book_id", BOOK_ID_AS_STRING, ids=BOOK_ID_AS_STRING_IDS)
 def test_delete_book_by_id_edge_cases_str_400(books_api_fixture: books_api.BooksAPI, book_id):
     """
     DELETE /Books/{id} should return 400 Bad Request for invalid book IDs.
@@ -360,7 +338,7 @@ def test_delete_book_by_id_edge_cases_str_400(books_api_fixture: books_api.Books
         "application/problem+json; charset=utf-8"
     )
     response_validators.validate_schema_and_model(
-        response.json(),
+        common_api.parse_json(response),
         common_schemas.ERROR_400_SCHEMA,
         common_models.Error400Response
     )
@@ -3,8 +3,11 @@ Data generator for creating book instances for testing purposes.
 This module provides a function to build a book object with random data using Faker.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
 from faker import Faker
-from tests.models import book_model
+
+_DEFAULT_FAKER = Faker()  # building Faker loads providers, so one instance is shared
 
 def build_book(book_id=None, faker_instance=None):
     """
@@ -12,19 +15,19 @@ def build_book(book_id=None, faker_instance=None):
     Args:
         book_id (int, optional): The ID of the book. If not provided, a random ID will be generated.
         faker_instance (Faker, optional): An instance of Faker to use for generating random data.
-            If not provided, a new Faker instance will be created.
+            If not provided, a shared module-level instance is used.
     Returns:
         dict: A dictionary representing a book with random data.
     """
-    fake = faker_instance or Faker()
-    return book_model.Book(
-        id=book_id or fake.random_int(min=1, max=10000),
-        title=fake.sentence(nb_words=4),
-        description=fake.paragraph(),
-        pageCount=fake.random_int(min=1, max=1000),
-        excerpt=fake.sentence(nb_words=6),
-        publishDate=fake.date_time_this_decade().isoformat()
-    ).model_dump(mode="json") # Convert to dict for JSON serialization
+    fake = faker_instance or _DEFAULT_FAKER
+    return {
+        "id": book_id or fake.random_int(min=1, max=10000),
+        "title": fake.sentence(nb_words=4),
+        "description": fake.paragraph(),
+        "pageCount": fake.random_int(min=1, max=1000),
+        "excerpt": fake.sentence(nb_words=6),
+        "publishDate": fake.date_time_this_decade().isoformat(),
+    }
 
 
 def build_author(author_id=None, book_id=None, faker_instance=None):
@@ -35,14 +38,36 @@ def build_author(author_id=None, book_id=None, faker_instance=None):
             a random ID will be generated.
         book_id (int, optional): The ID of the book. If not provided, a random ID will be generated.
         faker_instance (Faker, optional): An instance of Faker to use for generating random data.
-            If not provided, a new Faker instance will be created.
+            If not provided, a shared module-level instance is used.
     Returns:
         dict: A dictionary representing an author with random data.
     """
-    fake = faker_instance or Faker()
+    fake = faker_instance or _DEFAULT_FAKER
     return {
         "id": author_id or fake.random_int(min=1, max=10000),
         "idBook": book_id or fake.random_int(min=1, max=10000),
         "firstName": fake.first_name(),
         "lastName": fake.last_name(),
     }
+
+
+@lru_cache(maxsize=1)
+def build_book_template():
+    """
+    Build a book payload once per test session.
+    Meant for tests that only change one field, so the random data does not matter.
+    Returns:
+        MappingProxyType: A read-only book dict. Copy it with dict() before modifying.
+    """
+    return MappingProxyType(build_book())
+
+
+@lru_cache(maxsize=1)
+def build_author_template():
+    """
+    Build an author payload once per test session.
+    Meant for tests that only change one field, so the random data does not matter.
+    Returns:
+        MappingProxyType: A read-only author dict. Copy it with dict() before modifying.
+    """
+    return MappingProxyType(build_author())
@@ -2,9 +2,53 @@
 Utility functions to validate API responses in tests
 These functions check the status code, content type, API version, and headers.
 """
+import os
+from functools import lru_cache
 import pytest
-from jsonschema import validate, ValidationError as JsonSchemaValidationError
-from pydantic import ValidationError as PydanticValidationError
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+from pydantic import TypeAdapter, ValidationError as PydanticValidationError
+from tests.schemas import authors_schema, book_schema, common_schemas
+
+# JSON Schema checks run unless SCHEMA_CHECK=0 is set, e.g. for quicker local runs.
+# Pydantic models are always checked.
+SCHEMA_CHECK = os.environ.get("SCHEMA_CHECK", "1") != "0"
+
+_VALIDATOR_CACHE = {}  # id(schema) -> (schema, compiled validator)
+_ARRAY_SCHEMA_CACHE = {}  # id(item schema) -> (item schema, array schema)
+
+
+def _get_validator(schema):
+    """
+    Return a compiled JSON Schema validator for the given schema.
+    The validator class follows the schema's "$schema" keyword (Draft 2020-12 when absent).
+    The schema is checked against the meta-schema only once and the validator is reused
+    for every following call with the same schema object.
+    Args:
+        schema: The JSON Schema to compile.
+    Returns:
+        Validator: The validator for the schema.
+    """
+    cached = _VALIDATOR_CACHE.get(id(schema))
+    if cached is not None:
+        return cached[1]
+    validator_cls = validator_for(schema, default=Draft202012Validator)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+    # Holding the schema keeps it alive, so its id cannot be reused by another object
+    _VALIDATOR_CACHE[id(schema)] = (schema, validator)
+    return validator
+
+
+# Compile the suite's schemas at import time, so no test pays for the first compilation.
+for _schema in (
+    authors_schema.AUTHOR_SCHEMA,
+    book_schema.BOOK_SCHEMA,
+    common_schemas.ERROR_404_SCHEMA,
+    common_schemas.ERROR_400_SCHEMA,
+):
+    _get_validator(_schema)
 
 
 def assert_status_code(response, expected_code=200):
@@ -21,16 +65,36 @@ def assert_status_code(response, expected_code=200):
     )
 
 
+@lru_cache(maxsize=None)
+def _parse_content_type(content_type):
+    """
+    Split a Content-Type value into its media type and the set of its parameters.
+    Args:
+        content_type: The Content-Type value, e.g. "application/json; charset=utf-8".
+    Returns:
+        tuple: The lowercased media type and a frozenset of "name=value" parameters.
+    """
+    media_type, *params = content_type.lower().split(";")
+    return media_type.strip(), frozenset(p.strip() for p in params if p.strip())
+
+
 def assert_json_content_type(response, expected_type="application/json; charset=utf-8; v=1.0"):
     """
     Assert that the response content type is JSON.
+    The media type must match and every expected parameter must be present,
+    regardless of order or letter case.
     Args:
         response: The response object from the API call.
+        expected_type: The expected content type.
     Raises:
         AssertionError: If the content type is not JSON.
     """
     ct = response.headers.get("content-type", "")
-    assert ct.startswith(expected_type), f"Expected content-type {expected_type}, got {ct}"
+    media_type, params = _parse_content_type(ct)
+    expected_media_type, expected_params = _parse_content_type(expected_type)
+    assert media_type == expected_media_type and expected_params <= params, (
+        f"Expected content-type {expected_type}, got {ct}"
+    )
 
 
 def assert_api_version(response, expected_version="1.0"):
@@ -55,11 +119,41 @@ def assert_header_present(response, header_name):
     Raises:
         AssertionError: If the header is not present.
     """
-    assert header_name.lower() in [k.lower() for k in response.headers], (
+    # response.headers is case-insensitive, so no lowercasing is needed
+    assert header_name in response.headers, (
         f"Header {header_name} missing in response"
     )
 
 
+def assert_empty_body(response):
+    """
+    Assert that the response has no body.
+    The Content-Length header is checked when present, so the body is only read
+    when the server omits it (e.g. chunked responses).
+    Args:
+        response: The response object from the API call.
+    Raises:
+        AssertionError: If the response body is not empty.
+    """
+    content_length = response.headers.get("Content-Length")
+    if content_length is not None:
+        assert content_length == "0", f"Expected no content, got Content-Length {content_length}"
+    else:
+        assert not response.content, "Expected no content in response body"
+
+
+@lru_cache(maxsize=None)
+def _lowercased(header_names):
+    """
+    Return the given header names as a lowercased frozenset.
+    Args:
+        header_names: A tuple of header names.
+    Returns:
+        frozenset: The lowercased header names.
+    """
+    return frozenset(h.lower() for h in header_names)
+
+
 def assert_no_extra_headers(response, allowed_headers):
     """
     Assert that no headers are present in the response that are not in the allowed list.
@@ -69,31 +163,102 @@ def assert_no_extra_headers(response, allowed_headers):
     Raises:
         AssertionError: If any unexpected headers are found.
     """
-    extra = [k for k in response.headers if k.lower() not in [h.lower() for h in allowed_headers]]
+    allowed = _lowercased(tuple(allowed_headers))
+    extra = [k for k in response.headers if k.lower() not in allowed]
     assert not extra, f"Unexpected headers found: {extra}"
 
 
-def validate_schema_and_model(item, schema, model, idx=None, label=""):
+def validate_schema_and_model( # pylint: disable=too-many-arguments
+    item, schema, model, idx=None, label="", *, schema_check=None
+):
     """
-    Validate an item against a JSON Schema and a Pydantic model.
+    Validate an item against a Pydantic model and a JSON Schema.
+    The Pydantic model is checked first, and the JSON Schema check can be switched off
+    for quicker local runs.
     Args:
         item: The item to validate.
         schema: The JSON Schema to validate against.
         model: The Pydantic model to validate against.
         idx: The index of the item in a list (if applicable).
         label: A label for the item being validated (for error messages).
+        schema_check: Whether to run the JSON Schema check. Defaults to SCHEMA_CHECK.
     Raises:
         AssertionError: If the item fails validation against the schema or model.
     """
     pos = f" at index {idx}" if idx is not None else ""
     context = f"{label}{pos}".strip()
-    # JSON Schema validation
+    # Pydantic model validation
     try:
-        validate(instance=item, schema=schema)
-    except JsonSchemaValidationError as e:
-        pytest.fail(f"{context} failed JSON Schema validation: {e}")
+        model.model_validate(item)
+    except PydanticValidationError as e:
+        pytest.fail(f"{context} failed Pydantic model validation: {e}")
+    # JSON Schema validation
+    if schema_check is None:
+        schema_check = SCHEMA_CHECK
+    if not schema_check:
+        return
+    validator = _get_validator(schema)
+    if validator.is_valid(item):
+        return
+    # Only failing items pay for collecting the errors; report the most relevant one
+    error = best_match(validator.iter_errors(item))
+    pytest.fail(f"{context} failed JSON Schema validation: {error}")
+
+
+def _get_array_schema(item_schema):
+    """
+    Return a JSON Schema for a list whose items match the given schema.
+    Args:
+        item_schema: The JSON Schema of a single item.
+    Returns:
+        dict: The array schema, built once per item schema.
+    """
+    cached = _ARRAY_SCHEMA_CACHE.get(id(item_schema))
+    if cached is not None:
+        return cached[1]
+    array_schema = {"type": "array", "items": item_schema}
+    _ARRAY_SCHEMA_CACHE[id(item_schema)] = (item_schema, array_schema)
+    return array_schema
+
+
+@lru_cache(maxsize=None)
+def _get_list_adapter(model):
+    """
+    Return a Pydantic TypeAdapter validating a list of the given model.
+    Args:
+        model: The Pydantic model of a single item.
+    Returns:
+        TypeAdapter: The adapter for list[model].
+    """
+    return TypeAdapter(list[model])
+
+
+def validate_list_schema_and_model(items, item_schema, model, label="", *, schema_check=None):
+    """
+    Validate every item of a list against a Pydantic model and a JSON Schema in one call each.
+    Failure messages include the index of the offending item.
+    Args:
+        items: The list of items to validate.
+        item_schema: The JSON Schema of a single item.
+        model: The Pydantic model of a single item.
+        label: A label for the list being validated (for error messages).
+        schema_check: Whether to run the JSON Schema check. Defaults to SCHEMA_CHECK.
+    Raises:
+        AssertionError: If any item fails validation against the schema or model.
+    """
+    context = label.strip()
     # Pydantic model validation
     try:
-        model(**item)
+        _get_list_adapter(model).validate_python(items)
     except PydanticValidationError as e:
         pytest.fail(f"{context} failed Pydantic model validation: {e}")
+    # JSON Schema validation
+    if schema_check is None:
+        schema_check = SCHEMA_CHECK
+    if not schema_check:
+        return
+    validator = _get_validator(_get_array_schema(item_schema))
+    if validator.is_valid(items):
+        return
+    error = best_match(validator.iter_errors(items))
+    pytest.fail(f"{context} failed JSON Schema validation: {error}")